@@ -1,20 +1,60 @@
 import asyncio
+import atexit
+import functools
+import queue
+import sys
 import yaml
 import logging
+import logging.handlers
 from typing import Sequence, List
-import openai
-from autogen_ext.models.openai import OpenAIChatCompletionClient
 import os
-from autogen_ext.tools.mcp import McpWorkbench, StdioServerParams, SseServerParams
-from autogen_agentchat.teams import SelectorGroupChat
-from autogen_agentchat.conditions import TextMentionTermination
+from itertools import islice
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
 from util.config import _get_key
 
-from util.PlannerAgent import PlannerAgent
-from FilteredWorkbench import FilteredWorkbench
 from helper.streamParse import StreamAccumulator
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Debug log for the smart selector
+selector_logger = logging.getLogger("selector")
+selector_logger.setLevel(logging.INFO)
+selector_logger.propagate = False
+_selector_listener: logging.handlers.QueueListener | None = None
+
+
+def _start_selector_log() -> None:
+    """
+    Attaches the selector log on the first run. Records are queued and written by a listener thread, so the selector
+    never blocks the event loop on disk I/O; with delay=True the file is only opened once something is logged.
+    """
+    global _selector_listener
+    if _selector_listener is None:
+        handler = logging.handlers.RotatingFileHandler(
+            "selector_debug.log", maxBytes=10 * 1024 * 1024, backupCount=3, delay=True
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        selector_logger.addHandler(logging.handlers.QueueHandler(records))
+        _selector_listener = logging.handlers.QueueListener(records, handler)
+        _selector_listener.start()
+        atexit.register(_selector_listener.stop)
+
+
+# Agent names are interned so the many name comparisons in the selector helpers hit the identity fast path
+_ORCHESTRATOR = sys.intern("orchestrator")
+_SELECTED_AGENT_NAMES = tuple(sys.intern(n) for n in ("committee_specialist", "bill_specialist", _ORCHESTRATOR, "actions_specialist", "amendment_specialist", "congress_member_specialist"))
+
+
+def _load_yaml(path: str) -> dict:
+    """Parses a YAML config file with the libyaml-backed loader when it is available."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
 def _append_next_agent_instruction(agents_cfg: dict, agent_names: List[str]) -> None:
     """Mutate the description field of each agent by appending explicit hand-off instructions."""
     addon = (
@@ -22,8 +62,11 @@ def _append_next_agent_instruction(agents_cfg: dict, agent_names: List[str]) ->
         "'NEXT_AGENT: <agent_name>' where <agent_name> is one of "
         f"{agent_names} or TERMINATE."
     )
+    # The same suffix is shared by every agent description
+    addon = sys.intern(addon)
     for name in agent_names:
-        agents_cfg[name]["description"] += addon
+        agent_cfg = agents_cfg[name]
+        agent_cfg["description"] = "".join((agent_cfg["description"], addon))
 
 # ASSUMES: agent names are of the form "{agent_name}_{agent_tag}"
 def __augment_agent_names(agent_names: List[str]) -> List[str]:
@@ -34,33 +77,26 @@ def __augment_agent_names(agent_names: List[str]) -> List[str]:
     - Handles plurals, using an apostrophe for names already ending in 's' (e.g., actions -> actions').
     """
     new_names = []
+    append = new_names.append
     for name in agent_names:
-        if name == "orchestrator":
+        if name == _ORCHESTRATOR:
             # Orchestrator is a special case, no augmentation needed.
-            new_names.append(name)
+            append(name)
             continue
-        
+
         fragments = name.split("_")
         core_name, tag = " ".join(fragments[:-1]), fragments[-1]
 
-        # 1. Singular forms
-        new_names.append(f"{core_name} {tag}")          # e.g., "committee specialist"
-        new_names.append(f"specialist in {core_name}") # e.g., "specialist in committee"
+        # Plural form: "committee" -> "committees", but "actions" -> "actions'"
+        plural_core = core_name + ("'" if core_name.endswith('s') else "s")
 
-        # 2. Plural forms
-        if core_name.endswith('s'):
-            # For "actions", becomes "actions'"
-            plural_core = core_name + "'"
-        else:
-            # For "committee", becomes "committees"
-            plural_core = core_name + "s"
-        
-        new_names.append(f"{plural_core} {tag}")         # e.g., "committees specialist", "actions' specialist"
-        new_names.append(f"specialist in {plural_core}")# e.g., "specialist in committees", "specialist in actions'"
-        
-    # Remove duplicates while preserving the order of the LAST occurrence
-    
-    return new_names
+        append(f"{core_name} {tag}")            # e.g., "committee specialist"
+        append(f"specialist in {core_name}")    # e.g., "specialist in committee"
+        append(f"{plural_core} {tag}")          # e.g., "committees specialist", "actions' specialist"
+        append(f"specialist in {plural_core}")  # e.g., "specialist in committees", "specialist in actions'"
+
+    # Remove duplicates while preserving the order of the FIRST occurrence
+    return list(dict.fromkeys(new_names))
 
 
 def __deaugment_agent_name(augmented_name: str, canonical_names: List[str]) -> str:
@@ -77,9 +113,9 @@ def __deaugment_agent_name(augmented_name: str, canonical_names: List[str]) -> s
 
     # Iterate through each canonical name and check if any of its augmented forms match.
     for canonical_name in canonical_names:
-        if canonical_name == "orchestrator":
-            if normalized_input == "orchestrator":
-                return "orchestrator"
+        if canonical_name == _ORCHESTRATOR:
+            if normalized_input == _ORCHESTRATOR:
+                return _ORCHESTRATOR
             continue
 
         fragments = canonical_name.split("_")
@@ -111,7 +147,7 @@ def _check_agent_name_safety(agent_names: List[str]) -> bool:
     correctly mapped back to the original canonical name.
     """
     for canonical_name in agent_names:
-        if canonical_name == "orchestrator":
+        if canonical_name == _ORCHESTRATOR:
             continue
 
         # Re-create the specific augmented forms for this one agent to test them.
@@ -144,29 +180,120 @@ def _check_agent_name_safety(agent_names: List[str]) -> bool:
                 
     return True
 
+# Secrets files tried, in order, when the key is not available through util.config
+_SECRETS_PATHS = ("/app/secrets.ini", "/app/agentServer/secrets.ini", "secrets.ini")
+_oai_key: str | None = None
+
+
+def _load_oai_key() -> str | None:
+    """
+    Returns the OpenAI API key, or None if it cannot be found. The key is looked up once per
+    process; a failed lookup is not remembered, so a fixed secrets file is picked up by the next run.
+    """
+    global _oai_key
+    if _oai_key is not None:
+        return _oai_key
+    try:
+        _oai_key = _get_key("OPENAI_API_KEY")
+        return _oai_key
+    except Exception as e:
+        print(f"⚠️  API key loading failed: {e}")
+        print("💡 Trying alternative approach...")
+
+    # Try loading directly from secrets.ini
+    import configparser
+    for path in _SECRETS_PATHS:
+        if not os.path.exists(path):
+            continue
+        config = configparser.ConfigParser()
+        config.read(path)
+        try:
+            _oai_key = config["API_KEYS"]["OPENAI_API_KEY"]
+        except KeyError:
+            continue
+        print(f"✅ Found API key in {path}")
+        return _oai_key
+
+    print("❌ Could not find OpenAI API key")
+    return None
+
+
+# OpenAI clients shared by every run in the process, so each run does not set up new connection pools.
+# Both go through one sized httpx pool, so agent and selector traffic do not queue behind each other.
+_http_client = None
+_model_client = None
+_selector_client = None
+
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        import httpx
+        from openai import DefaultAsyncHttpxClient
+
+        _http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+def _get_model_client(oai_key: str):
+    """Returns the process-wide gpt-4.1-mini model client for the agents, creating it on first use."""
+    global _model_client
+    if _model_client is None:
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+        _model_client = OpenAIChatCompletionClient(
+            model="gpt-4.1-mini", api_key=oai_key, http_client=_get_http_client()
+        )
+    return _model_client
+
+
+def _get_selector_client(oai_key: str):
+    """Returns the process-wide AsyncOpenAI client used by the LLM selector, creating it on first use."""
+    global _selector_client
+    if _selector_client is None:
+        import openai
+
+        _selector_client = openai.AsyncOpenAI(api_key=oai_key, http_client=_get_http_client())
+    return _selector_client
+
+# The selectors only look this far back in the thread for the last chat message
+_SELECTOR_LOOKBACK = 64
+
+_LAST_MESSAGE_SLOT = "{last_message}"
+
+
+@functools.lru_cache(maxsize=4)
+def _render_selector_template(template: str, agent_names: tuple[str, ...]) -> str:
+    """
+    Fills in everything in the selector prompt except the last message, which stays as a literal
+    {last_message} slot for str.replace, so only the message varies per selector call.
+    """
+    return template.format(agent_names=list(agent_names), last_message=_LAST_MESSAGE_SLOT)
+
 def _create_llm_selector(agent_names: List[str], prompt_cfg: dict, oai_key: str) -> callable:
     """Creates a closure for the selector function that has access to agent names."""
-    def _llm_selector(thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str | None:
-        last_msg = next((m for m in reversed(thread) if isinstance(m, BaseChatMessage)), None)
+    client = _get_selector_client(oai_key)
+    template = _render_selector_template(prompt_cfg["selector_prompt"]["description"], tuple(agent_names))
+    agent_name_set = frozenset(agent_names)
+
+    async def _llm_selector(thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str | None:
+        last_msg = next((m for m in islice(reversed(thread), _SELECTOR_LOOKBACK) if isinstance(m, BaseChatMessage)), None)
         if not last_msg:
             return None
 
-        prompt = prompt_cfg["selector_prompt"]["description"].format(agent_names=agent_names, last_message=last_msg.content)
+        prompt = template.replace(_LAST_MESSAGE_SLOT, str(last_msg.content))
 
-        openai.api_key = oai_key
-        response = openai.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-mini",  # Updated to use mini model like autogen5.py
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that selects the next agent to call."},
                 {"role": "user", "content": prompt}
             ]
         )
-        model_result = type("ModelResult", (), {"content": response.choices[0].message.content})()
-
-        if model_result.content.strip() in agent_names:
-            return model_result.content.strip()
-        else:
-            return None
+        content = (response.choices[0].message.content or "").strip()
+        return content if content in agent_name_set else None
 
     return _llm_selector
 
@@ -258,145 +385,134 @@ class WebSocketStreamingConsole:
 
 local_path = os.path.dirname(os.path.abspath(__file__))
 
+# Connect to ragMCP server running in separate Docker container using SSE
+_RAGMCP_SSE_URL = f"{os.getenv('RAGMCP_URL', 'http://ragmcp:8080')}/sse"  # SSE endpoint path
+
+# Updated tool allowlists to match autogen5.py
+_ALLOWED_TOOL_NAMES_ORCHESTRATOR = ("getBillSummary",)
+_ALLOWED_TOOL_NAMES_COMM = ("get_committee_members", "get_committee_actions", "getBillCommittees")
+_ALLOWED_TOOL_NAMES_BILL = ("getBillSponsors", "getBillCoSponsors", "getBillCommittees", "getRelevantBillSections", "getBillSummary")
+_ALLOWED_TOOL_NAMES_ACTIONS = ("extractBillActions", "get_committee_actions")
+_ALLOWED_TOOL_NAMES_AMENDMENTS = ("getAmendmentSponsors", "getAmendmentCoSponsors", "getBillAmendments", "getAmendmentText", "getAmendmentActions")
+_ALLOWED_TOOL_NAMES_CONGRESS_MEMBERS = ("getCongressMemberName", "getCongressMemberParty", "getCongressMemberState", "getBillSponsors", "getBillCoSponsors")
+
+
+@functools.lru_cache(maxsize=64)
+def _render_description(template: str, agent_names: tuple[str, ...], company_name: str, bill: str) -> str:
+    """Fills in an agent description; repeated runs for the same company and bill reuse the rendered text."""
+    # str.format_map ignores unused keys, so every description is rendered from the same mapping
+    return template.format_map({"agent_names": list(agent_names), "company_name": company_name, "bill": bill})
+
+
+async def run_full_investigation(company_name: str, bill: str, websocket_callback=None, *, workbench=None) -> None:
+    """
+    Run the full multi-agent investigation with WebSocket output using autogen5 configuration.
+    A started `workbench` can be passed in to reuse its MCP session; it is then left open for the caller.
+    """
+    # The model client, MCP and team stacks are heavy to import, so they are only loaded once a run starts
+    from autogen_ext.tools.mcp import McpWorkbench, SseServerParams
+    from autogen_agentchat.teams import SelectorGroupChat
+    from autogen_agentchat.conditions import TextMentionTermination
+    from util.PlannerAgent import PlannerAgent
+    from FilteredWorkbench import FilteredWorkbench
+
+    _start_selector_log()
 
-async def run_full_investigation(company_name: str, bill: str, websocket_callback=None) -> None:
-    """Run the full multi-agent investigation with WebSocket output using autogen5 configuration"""
     # -------------------- Config & constants --------------------
     year = 2018  # Added year parameter from autogen5.py
-    selected_agent_names = ["committee_specialist", "bill_specialist", "orchestrator", "actions_specialist", "amendment_specialist", "congress_member_specialist"]
-
-    # -------------------- Load YAML configs --------------------
-    # Updated to use agents_5.yaml and tasks_5.yaml
-    with open(f"{local_path}/config/agents.yaml", "r") as f:
-        agents_cfg = yaml.safe_load(f)
-    with open(f"{local_path}/config/tasks.yaml", "r") as f:
-        tasks_cfg = yaml.safe_load(f)
-    with open(f"{local_path}/config/prompt.yaml", "r") as f:
-        prompt_cfg = yaml.safe_load(f)
-
-    # -------------------- Model client --------------------
+
+    # -------------------- Workbench setup --------------------
+    workbench_start = None
+    if workbench is None:
+        ragmcp_params = SseServerParams(
+            url=_RAGMCP_SSE_URL,
+            timeout=60,  # Note: parameter name is 'timeout' not 'timeout_seconds'
+        )
+        # Connecting to the MCP server is the slowest part of the setup, so it runs while the configs are loaded
+        workbench = McpWorkbench(server_params=ragmcp_params)
+        workbench_start = asyncio.create_task(workbench.start())
     try:
-        oai_key = _get_key("OPENAI_API_KEY")
-    except Exception as e:
-        print(f"⚠️  API key loading failed: {e}")
-        print("💡 Trying alternative approach...")
-        
-        # Try loading directly from secrets.ini
-        import configparser
-        config = configparser.ConfigParser()
-        secrets_paths = [
-            "/app/secrets.ini",
-            "/app/agentServer/secrets.ini", 
-            "secrets.ini"
-        ]
-        
-        oai_key = None
-        for path in secrets_paths:
-            if os.path.exists(path):
-                config.read(path)
-                try:
-                    oai_key = config["API_KEYS"]["OPENAI_API_KEY"]
-                    print(f"✅ Found API key in {path}")
-                    break
-                except KeyError:
-                    continue
-        
+        # -------------------- Load YAML configs --------------------
+        # Updated to use agents_5.yaml and tasks_5.yaml; the three files are read and parsed concurrently
+        agents_cfg, tasks_cfg, prompt_cfg = await asyncio.gather(
+            asyncio.to_thread(_load_yaml, f"{local_path}/config/agents.yaml"),
+            asyncio.to_thread(_load_yaml, f"{local_path}/config/tasks.yaml"),
+            asyncio.to_thread(_load_yaml, f"{local_path}/config/prompt.yaml"),
+        )
+
+        # -------------------- Model client --------------------
+        oai_key = _load_oai_key()
         if not oai_key:
-            print("❌ Could not find OpenAI API key")
             return
 
-    # Updated to use gpt-4.1-mini like autogen5.py
-    model_client = OpenAIChatCompletionClient(model="gpt-4.1-mini", api_key=oai_key)
-
-    # -------------------- Workbench setup --------------------
-    # Connect to ragMCP server running in separate Docker container using SSE
-    ragmcp_base_url = os.getenv("RAGMCP_URL", "http://ragmcp:8080")
-    ragmcp_sse_url = f"{ragmcp_base_url}/sse"  # SSE endpoint path
-    params = SseServerParams(
-        url=ragmcp_sse_url,
-        timeout=60,  # Note: parameter name is 'timeout' not 'timeout_seconds'
-    )
-
-    async with McpWorkbench(server_params=params) as workbench:
-        # Updated tool allowlists to match autogen5.py
-        allowed_tool_names_orchestrator = ["getBillSummary"]
-        allowed_tool_names_comm = ["get_committee_members", "get_committee_actions", "getBillCommittees"]
-        allowed_tool_names_bill = ["getBillSponsors", "getBillCoSponsors", "getBillCommittees", "getRelevantBillSections", "getBillSummary"]
-        allowed_tool_names_actions = ["extractBillActions", "get_committee_actions"]
-        allowed_tool_names_amendments = ["getAmendmentSponsors", "getAmendmentCoSponsors", "getBillAmendments", "getAmendmentText", "getAmendmentActions"]
-        allowed_tool_names_congress_members = ["getCongressMemberName", "getCongressMemberParty", "getCongressMemberState", "getBillSponsors", "getBillCoSponsors"]
-
-        workbench_comm = FilteredWorkbench(workbench, allowed_tool_names_comm)
-        workbench_bill = FilteredWorkbench(workbench, allowed_tool_names_bill)
-        workbench_actions = FilteredWorkbench(workbench, allowed_tool_names_actions)
-        workbench_amendments = FilteredWorkbench(workbench, allowed_tool_names_amendments)
-        workbench_congress_members = FilteredWorkbench(workbench, allowed_tool_names_congress_members)
-        workbench_orchestrator = FilteredWorkbench(workbench, allowed_tool_names_orchestrator)
+        # Updated to use gpt-4.1-mini like autogen5.py
+        model_client = _get_model_client(oai_key)
+
+        if workbench_start is not None:
+            await workbench_start
+        workbench_comm = FilteredWorkbench(workbench, _ALLOWED_TOOL_NAMES_COMM)
+        workbench_bill = FilteredWorkbench(workbench, _ALLOWED_TOOL_NAMES_BILL)
+        workbench_actions = FilteredWorkbench(workbench, _ALLOWED_TOOL_NAMES_ACTIONS)
+        workbench_amendments = FilteredWorkbench(workbench, _ALLOWED_TOOL_NAMES_AMENDMENTS)
+        workbench_congress_members = FilteredWorkbench(workbench, _ALLOWED_TOOL_NAMES_CONGRESS_MEMBERS)
+        workbench_orchestrator = FilteredWorkbench(workbench, _ALLOWED_TOOL_NAMES_ORCHESTRATOR)
+        # Built per run: the termination condition keeps state between turns
         termination_condition = TextMentionTermination("TERMINATE")
 
         # Updated agent descriptions to match autogen5.py format (removed advancement parameter)
-        committee_specialist = PlannerAgent(
-                name = "committee_specialist",
-                description = agents_cfg["committee_specialist"]["description"].format(agent_names=selected_agent_names, company_name=company_name),
-                model_client=model_client,
-                workbench=workbench_comm,
-                model_client_stream=True,
-                reflect_on_tool_use=True
-            )
-        bill_specialist = PlannerAgent(
-                name="bill_specialist",
-                description=agents_cfg["bill_specialist"]["description"].format(bill=bill, agent_names=selected_agent_names, company_name=company_name),
-                model_client=model_client,
-                workbench=workbench_bill,
-                model_client_stream=True,
-                reflect_on_tool_use=True
-            )
-
-        actions_specialist = PlannerAgent(
-                name="actions_specialist",
-                description=agents_cfg["actions_specialist"]["description"].format(agent_names=selected_agent_names, company_name=company_name),
-                model_client=model_client,
-                workbench=workbench_actions,
-                model_client_stream=True,
-                reflect_on_tool_use=True
-            )
-
-        amendment_specialist = PlannerAgent(
-                name="amendment_specialist",
-                description=agents_cfg["amendment_specialist"]["description"].format(agent_names=selected_agent_names, company_name=company_name),
-                model_client=model_client,
-                workbench=workbench_amendments,
-                model_client_stream=True,
-                reflect_on_tool_use=True
-            )
-
-        congress_member_specialist = PlannerAgent(
-                name="congress_member_specialist",
-                description=agents_cfg["congress_member_specialist"]["description"].format(agent_names=selected_agent_names, company_name=company_name),
+        # (agent name, workbench) for each specialist
+        spec_defs = [
+            ("committee_specialist", workbench_comm),
+            ("bill_specialist", workbench_bill),
+            ("actions_specialist", workbench_actions),
+            ("amendment_specialist", workbench_amendments),
+            ("congress_member_specialist", workbench_congress_members),
+        ]
+        rendered = {
+            name: _render_description(agents_cfg[name]["description"], _SELECTED_AGENT_NAMES, company_name, bill)
+            for name, _ in spec_defs
+        }
+        # The orchestrator is told about the specialists only
+        rendered[_ORCHESTRATOR] = _render_description(
+            agents_cfg[_ORCHESTRATOR]["description"], tuple(name for name, _ in spec_defs), company_name, bill
+        )
+        agents = [
+            PlannerAgent(
+                name=name,
+                description=rendered[name],
                 model_client=model_client,
-                workbench=workbench_congress_members,
+                workbench=wb,
                 model_client_stream=True,
                 reflect_on_tool_use=True
             )
-
-        agents = [committee_specialist, bill_specialist, actions_specialist, amendment_specialist, congress_member_specialist]
-        agent_names = [agent.name for agent in agents]
+            for name, wb in spec_defs
+        ]
         orchestrator = PlannerAgent(
-                name="orchestrator",
-                description= agents_cfg["orchestrator"]["description"].format(bill=bill, agent_names=agent_names, company_name=company_name),
+                name=_ORCHESTRATOR,
+                description=rendered[_ORCHESTRATOR],
                 model_client=model_client,
                 model_client_stream=True,
                 workbench=workbench_orchestrator
             )
         agents.append(orchestrator)
+        # Every participant, orchestrator included; a tuple so it can be shared and hashed downstream
+        final_agent_names = tuple(agent.name for agent in agents)
             
         # Create the selector function with access to the agent names
-        smart_selector = _create_smart_selector(agent_names=[a.name for a in agents])
-        llm_selector = _create_llm_selector(agent_names=[a.name for a in agents], prompt_cfg=prompt_cfg, oai_key=oai_key)
+        smart_selector = _create_smart_selector(agent_names=final_agent_names)
+        llm_selector = _create_llm_selector(agent_names=final_agent_names, prompt_cfg=prompt_cfg, oai_key=oai_key)
 
-        if not _check_agent_name_safety(agent_names):
+        # The round-trip check only depends on the fixed agent names, so it is opt-in (and compiled out under -O)
+        if __debug__ and os.getenv("AGENT_SAFETY_CHECK"):
+            if not _check_agent_name_safety(final_agent_names):
                 raise ValueError("Agent names are not safe to use in the selector function.")
 
+        # Fill every wrapper's filtered tool list before the team starts; they share one list_tools round-trip
+        await asyncio.gather(*(
+            wb.list_tools()
+            for wb in (workbench_comm, workbench_bill, workbench_actions, workbench_amendments, workbench_congress_members, workbench_orchestrator)
+        ))
+
         team = SelectorGroupChat(
                 agents,
                 termination_condition=termination_condition,
@@ -406,18 +522,49 @@ async def run_full_investigation(company_name: str, bill: str, websocket_callbac
             )
             
         # Use WebSocket streaming console instead of regular Console
-        # Define all agents for full investigation
-        all_agent_names = [agent.name for agent in agents]
-            
         console = WebSocketStreamingConsole(
                 # Updated task format to match autogen5.py (using year and bill_name parameters)
                 team.run_stream(task=tasks_cfg["main_task"]["description"].format(year=year, bill_name=bill, company_name=company_name)),
                 websocket_callback,
-                allowed_agents=all_agent_names  # Pass all agent names for full investigation
+                allowed_agents=final_agent_names  # Pass all agent names for full investigation
             )
         await console.run()
+    finally:
+        # Only a workbench that this run started, and that finished starting, has a session to close
+        if workbench_start is not None:
+            if not workbench_start.done():
+                workbench_start.cancel()
+            elif not workbench_start.cancelled() and workbench_start.exception() is None:
+                await workbench.stop()
+
+
+
+async def run_batch_investigations(
+    inputs: Sequence[tuple[str, str]], websocket_callback=None, *, concurrency: int = 4
+) -> None:
+    """
+    Runs one investigation per (company_name, bill) pair, at most `concurrency` at a time.
+    All runs share a single MCP session, so the SSE handshake happens once instead of once per run.
+    """
+    from autogen_ext.tools.mcp import McpWorkbench, SseServerParams
+
+    sem = asyncio.Semaphore(concurrency)
+    workbench = McpWorkbench(server_params=SseServerParams(url=_RAGMCP_SSE_URL, timeout=60))
+
+    async def _run_one(company_name: str, bill: str) -> None:
+        async with sem:
+            await run_full_investigation(company_name, bill, websocket_callback, workbench=workbench)
+
+    async with workbench:
+        await asyncio.gather(*(_run_one(company_name, bill) for company_name, bill in inputs))
 
 
 if __name__ == "__main__":
+    # Use the libuv event loop when it is installed; uvicorn already picks it up on its own
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     # Test run
     asyncio.run(run_full_investigation("ExxonMobil", "s383-116"))
\ No newline at end of file
@@ -0,0 +1,6 @@
+from investigation import _SELECTED_AGENT_NAMES, _check_agent_name_safety
+
+
+def test_agent_name_roundtrip():
+    # Every augmented form of the hard-coded agent names must map back to its own agent
+    assert _check_agent_name_safety(_SELECTED_AGENT_NAMES)
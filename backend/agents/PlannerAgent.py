@@ -2,23 +2,86 @@
 # to plan ahead before executing a tool call, in order to avoid tool calls with empty arguments
 
 from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import (
     ToolCallRequestEvent,
 )
 from autogen_core import FunctionCall
+from autogen_core.model_context import ChatCompletionContext
 from autogen_core.models import (
     CreateResult,
     AssistantMessage,
 )
 
 import yaml
+import asyncio
+import functools
 import json
 import re
-import openai
 import os
+import weakref
+from itertools import islice
+from typing import Sequence
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
 local_path = os.path.dirname(os.path.abspath(__file__))
 
+# Only this many of the most recent context messages are searched for the last message of another agent
+_MESSAGE_LOOKBACK = 64
+
+# Parsed prompt configs keyed by path; an entry is reused until the file's mtime changes
+_PROMPT_CFG_CACHE: dict[str, tuple[float, dict]] = {}
+
+
+def _load_prompt_cfg(path: str) -> dict:
+    """
+    Returns the parsed YAML config at `path`, only re-reading the file if it changed on disk.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    st = os.stat(path)
+    cached = _PROMPT_CFG_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime:
+        return cached[1]
+    with open(path, 'r') as file:
+        prompt_config = yaml.load(file, Loader=_YamlLoader) or {}
+    _PROMPT_CFG_CACHE[path] = (st.st_mtime, prompt_config)
+    return prompt_config
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_prompt_cfg_path() -> str | None:
+    """
+    Returns the path of the prompt config to use, preferring config/prompts.yaml over config/prompt.yaml,
+    or None if neither exists. Resolved once per process.
+    """
+    for file_name in ("prompts.yaml", "prompt.yaml"):
+        path = f"{local_path}/config/{file_name}"
+        if os.path.exists(path):
+            return path
+    return None
+
+
+# (tool name -> description, tool name -> required parameters) per workbench. The tool catalog is fixed
+# for the lifetime of a workbench, and entries are dropped automatically once it is garbage collected
+_TOOL_INFO_CACHE: "weakref.WeakKeyDictionary[object, tuple[dict[str, str], dict[str, list[str]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 class PlannerAgent(AssistantAgent):
     """
     An AssistantAgent that intercepts ANY tool-call request with empty arguments,
@@ -27,66 +90,69 @@ class PlannerAgent(AssistantAgent):
     original tool call using the inferred JSON arguments.
     """
 
-    @classmethod
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Kept so run_batch_async can build independent agents from the same configuration
+        self._init_args = (args, kwargs)
+
+    async def run_batch_async(self, tasks: Sequence[str], *, concurrency: int = 8) -> list[TaskResult]:
+        """
+        Runs every task independently, at most `concurrency` at a time, and returns the results in task order.
+        Each task runs on a new agent built from this agent's constructor arguments, so the runs share no
+        model context, tool list or run state. The model client and any workbench passed in are shared.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _run_one(task: str) -> TaskResult:
+            agent = self._fresh_copy()
+            async with sem:
+                return await agent.run(task=task)
+
+        return list(await asyncio.gather(*(_run_one(task) for task in tasks)))
+
+    def _fresh_copy(self) -> "PlannerAgent":
+        """Builds a new agent from the arguments this one was constructed with."""
+        args, kwargs = self._init_args
+        kwargs = dict(kwargs)
+        # A context passed in is copied from its config, so the new agent starts from the same initial messages
+        if kwargs.get("model_context") is not None:
+            kwargs["model_context"] = ChatCompletionContext.load_component(kwargs["model_context"].dump_component())
+        return type(self)(*args, **kwargs)
+
     async def _process_model_result(
-        cls,
+        self,
         model_result: CreateResult,
-        inner_messages: list,
-        cancellation_token,
+        *,
         agent_name,
-        system_messages,
         model_context,
         workbench,
-        handoff_tools,
-        handoffs,
-        model_client,
-        model_client_stream,
-        reflect_on_tool_use,
-        tool_call_summary_format,
-        tool_call_summary_formatter,
-        max_tool_iterations,
-        output_content_type,
-        message_id,
-        format_string=None,
+        **forward_kwargs,
     ):
         # Load prompts; prefer config/prompts.yaml if present; fallback to config/prompt.yaml
-        prompt_config = {}
-        try:
-            with open((f"{local_path}/config/prompts.yaml"), 'r') as file:
-                prompt_config = yaml.safe_load(file) or {}
-        except FileNotFoundError:
-            try:
-                with open((f"{local_path}/config/prompt.yaml"), 'r') as file:
-                    prompt_config = yaml.safe_load(file) or {}
-            except FileNotFoundError:
-                prompt_config = {}
+        prompt_config_path = _resolve_prompt_cfg_path()
+        prompt_config = _load_prompt_cfg(prompt_config_path) if prompt_config_path else {}
 
-        # Proceed only if there are tool calls; handle both wrappers and raw FunctionCall objects
-        has_tool_calls = isinstance(model_result.content, list) and any(
-            isinstance(evt, ToolCallRequestEvent) or isinstance(evt, FunctionCall)
-            for evt in model_result.content
+        # Everything except the model result is forwarded unchanged to the parent implementation
+        delegate = functools.partial(
+            super()._process_model_result,
+            agent_name=agent_name,
+            model_context=model_context,
+            workbench=workbench,
+            **forward_kwargs,
         )
-        if not has_tool_calls:
-            async for event in super()._process_model_result(
-                model_result,
-                inner_messages,
-                cancellation_token,
-                agent_name,
-                system_messages,
-                model_context,
-                workbench,
-                handoff_tools,
-                handoffs,
-                model_client,
-                model_client_stream,
-                reflect_on_tool_use,
-                tool_call_summary_format,
-                tool_call_summary_formatter,
-                max_tool_iterations,
-                output_content_type,
-                message_id,
-                format_string,
-            ):
+
+        # Proceed only if there are tool calls; handle both wrappers and raw FunctionCall objects
+        pending_calls: list[FunctionCall] = []
+        if isinstance(model_result.content, list):
+            for evt in model_result.content:
+                # 1) Wrapped batch of calls
+                if isinstance(evt, ToolCallRequestEvent):
+                    pending_calls.extend(evt.content)
+                # 2) Single raw FunctionCall
+                elif isinstance(evt, FunctionCall):
+                    pending_calls.append(evt)
+        if not pending_calls:
+            async for event in delegate(model_result):
                 yield event
             return
 
@@ -96,7 +162,7 @@ class PlannerAgent(AssistantAgent):
                 msgs = await model_context.get_messages()
             except Exception:
                 return ""
-            for msg in reversed(msgs):
+            for msg in islice(reversed(msgs), _MESSAGE_LOOKBACK):
                 src = getattr(msg, "source", None)
                 content = getattr(msg, "content", None)
                 if isinstance(content, str) and src and src != agent_name:
@@ -105,10 +171,6 @@ class PlannerAgent(AssistantAgent):
 
         last_message_text = await _get_last_other_message_text()
 
-        # Prepare OpenAI client
-        oai_key = os.getenv("OPENAI_API_KEY")
-        openai.api_key = oai_key
-
         # Helper to extract JSON from a string robustly
         def _parse_json_maybe(s: str) -> dict:
             """
@@ -120,7 +182,7 @@ class PlannerAgent(AssistantAgent):
             if not isinstance(s, str):
                 return {}
             try:
-                obj = json.loads(s)
+                obj = _json_loads(s)
                 if isinstance(obj, dict):
                     return obj
             except Exception:
@@ -145,7 +207,7 @@ class PlannerAgent(AssistantAgent):
                 # Replace single quotes with double quotes for JSON compatibility
                 block_fixed = block.replace("'", '"')
                 try:
-                    obj = json.loads(block_fixed)
+                    obj = _json_loads(block_fixed)
                     if isinstance(obj, dict):
                         return obj
                 except Exception:
@@ -191,68 +253,53 @@ class PlannerAgent(AssistantAgent):
 
         # Build a lookup of tool descriptions from the workbench (if provided)
         tool_descriptions: dict[str, str] = {}
+        tool_required_params: dict[str, list[str]] = {}
         try:
             if workbench is not None and hasattr(workbench[0], "list_tools"):
-                tools = await workbench[0].list_tools()  # type: ignore[reportUnknownArgumentType]
-                for t in tools:
-                    # Support both dict-like and attribute-like access
-                    name = t["name"] if isinstance(t, dict) else getattr(t, "name", None)
-                    desc = t.get("description", "") if isinstance(t, dict) else getattr(t, "description", "")
-                    if name:
-                        tool_descriptions[name] = desc or ""
+                cached_info = _TOOL_INFO_CACHE.get(workbench[0])
+                if cached_info is not None:
+                    tool_descriptions, tool_required_params = cached_info
+                else:
+                    tools = await workbench[0].list_tools()  # type: ignore[reportUnknownArgumentType]
+                    for t in tools:
+                        # Support both dict-like and attribute-like access
+                        name = t["name"] if isinstance(t, dict) else getattr(t, "name", None)
+                        desc = t.get("description", "") if isinstance(t, dict) else getattr(t, "description", "")
+                        # ToolSchema exposes the JSON schema as `parameters`, raw MCP tools as `inputSchema`
+                        if isinstance(t, dict):
+                            schema = t.get("parameters") or t.get("inputSchema") or {}
+                        else:
+                            schema = getattr(t, "parameters", None) or getattr(t, "inputSchema", None) or {}
+                        if name:
+                            tool_descriptions[name] = desc or ""
+                            tool_required_params[name] = list(schema.get("required", []) or [])
+                    _TOOL_INFO_CACHE[workbench[0]] = (tool_descriptions, tool_required_params)
         except Exception:
             pass
 
         # Mutate every tool call arguments using LLM inference (regardless of being empty or not)
-        if isinstance(model_result.content, list):
-            for evt in model_result.content:
-                # 1) Wrapped batch of calls
-                if isinstance(evt, ToolCallRequestEvent):
-                    calls_iter = evt.content
-                # 2) Single raw FunctionCall
-                elif isinstance(evt, FunctionCall):
-                    calls_iter = [evt]
-                else:
-                    continue
+        for call in pending_calls:
+            # A tool without required parameters is correctly called with no arguments
+            if tool_required_params.get(call.name) == []:
+                continue
+            description = tool_descriptions.get(call.name, "")
+            # Normalize sent arguments to a JSON string for the prompt
+            if isinstance(call.arguments, str) and call.arguments.strip() != "":
+                sent_arguments = call.arguments
+            elif isinstance(call.arguments, dict):
+                sent_arguments = _json_dumps(call.arguments)
+            else:
+                sent_arguments = "{}"
 
-                for call in calls_iter:
-                    description = tool_descriptions.get(call.name, "")
-                    # Normalize sent arguments to a JSON string for the prompt
-                    if isinstance(call.arguments, str) and call.arguments.strip() != "":
-                        sent_arguments = call.arguments
-                    elif isinstance(call.arguments, dict):
-                        sent_arguments = json.dumps(call.arguments)
-                    else:
-                        sent_arguments = "{}"
-
-                    description_args = _parse_json_maybe(description)
-                    sent_arguments = _parse_json_maybe(sent_arguments)
-                    if sent_arguments == {} or not _json_structures_equal(sent_arguments, description_args):
-                        model_context.add_message(AssistantMessage(
-                            content=f"INCORRECT ARGUMENTS TO TOOL CALL: {call.name}",
-                            source=agent_name
-                        ))
+            description_args = _parse_json_maybe(description)
+            sent_arguments = _parse_json_maybe(sent_arguments)
+            if sent_arguments == {} or not _json_structures_equal(sent_arguments, description_args):
+                model_context.add_message(AssistantMessage(
+                    content=f"INCORRECT ARGUMENTS TO TOOL CALL: {call.name}",
+                    source=agent_name
+                ))
 
 
         # Delegate to parent with updated arguments
-        async for event in super()._process_model_result(
-            model_result,
-            inner_messages,
-            cancellation_token,
-            agent_name,
-            system_messages,
-            model_context,
-            workbench,
-            handoff_tools,
-            handoffs,
-            model_client,
-            model_client_stream,
-            reflect_on_tool_use,
-            tool_call_summary_format,
-            tool_call_summary_formatter,
-            max_tool_iterations,
-            output_content_type,
-            message_id,
-            format_string,
-        ):
+        async for event in delegate(model_result):
             yield event
\ No newline at end of file
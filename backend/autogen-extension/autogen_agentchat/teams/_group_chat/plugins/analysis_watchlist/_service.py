@@ -7,6 +7,7 @@ This service uses an LLM (gpt-4o-mini) to:
 """
 
 from __future__ import annotations
+import functools
 import json
 import logging
 from typing import Any
@@ -39,6 +40,44 @@ class AnalysisScoresStructured(BaseModel):
     )
 
 
+class ComponentItem(BaseModel):
+    """A single watchlist criterion extracted from the user's analysis description."""
+    label: str = Field(description="2-3 word kebab-case identifier")
+    description: str = Field(description="1-2 sentence explanation of what to check")
+
+
+class AnalysisComponentsStructured(BaseModel):
+    """Structured schema for OpenAI output when extracting watchlist components."""
+    components: list[ComponentItem] = Field(
+        description="List of extracted criteria"
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _render_criteria(criteria: tuple[tuple[str, str], ...]) -> tuple[str, str, str, str]:
+    """
+    Render the parts of the scoring prompt that depend only on the components.
+
+    The components are fixed for a run while every agent message is scored, so these
+    are built once per component set instead of once per message.
+
+    Returns:
+        (criteria bullet list, comma-separated labels, example scores JSON, example reasoning JSON)
+    """
+    components_text = "\n".join(f"- {label}: {description}" for label, description in criteria)
+    component_labels = [label for label, _ in criteria]
+    # Create example using actual component labels
+    example_scores = {label: 5 for label in component_labels[:2]}  # Use first 2 for example
+    example_reasoning = {label: "Example reasoning" if i == 0 else ""
+                        for i, label in enumerate(component_labels[:2])}
+    return (
+        components_text,
+        ", ".join(component_labels),
+        json.dumps(example_scores, indent=4),
+        json.dumps(example_reasoning, indent=4),
+    )
+
+
 class AnalysisService:
     """
     Service for parsing analysis prompts and scoring messages.
@@ -97,10 +136,18 @@ Example:
         try:
             logger.info(f"[PARSE_PROMPT] Calling LLM to parse analysis prompt ({len(prompt)} chars)")
 
-            response = await self.model_client.create(
-                messages=[UserMessage(content=parse_prompt_text, source="user")],
-                # No json_output/response_format for MVP - we'll parse JSON manually
-            )
+            # Use structured output so the reply is schema-valid JSON; fall back for clients without it
+            try:
+                response = await self.model_client.create(
+                    messages=[UserMessage(content=parse_prompt_text, source="user")],
+                    json_output=AnalysisComponentsStructured
+                )
+            except ValueError:
+                # Raised by the client before any request is sent when the model lacks structured output;
+                # API errors such as rate limits or timeouts are not retried here
+                response = await self.model_client.create(
+                    messages=[UserMessage(content=parse_prompt_text, source="user")]
+                )
 
             # Extract content from response
             if not response.content:
@@ -110,7 +157,11 @@ Example:
             logger.debug(f"[PARSE_PROMPT] LLM response: {content[:200]}...")
 
             # Parse JSON response
-            data = json.loads(content)
+            try:
+                data = AnalysisComponentsStructured.model_validate_json(content).model_dump()
+            except Exception:
+                # Fallback to plain JSON parsing
+                data = json.loads(content)
             components_data = data.get("components", [])
 
             if not components_data:
@@ -177,22 +228,14 @@ Example:
             logger.warning("No components provided to score_message")
             return {}
 
-        # Format components as bullet list
-        components_text = "\n".join([
-            f"- {comp.label}: {comp.description}"
-            for comp in components
-        ])
+        components_text, labels_text, example_scores_json, example_reasoning_json = _render_criteria(
+            tuple((comp.label, comp.description) for comp in components)
+        )
 
         # Handle empty context with placeholders
         facts_section = tool_call_facts if tool_call_facts and tool_call_facts.strip() else "(No trusted facts yet)"
         context_section = state_of_run if state_of_run and state_of_run.strip() else "(No context yet)"
 
-        # Create example using actual component labels
-        component_labels = [comp.label for comp in components]
-        example_scores = {label: 5 for label in component_labels[:2]}  # Use first 2 for example
-        example_reasoning = {label: "Example reasoning" if i == 0 else ""
-                            for i, label in enumerate(component_labels[:2])}
-
         scoring_prompt = f"""Analyze this agent message against the watchlist criteria below.
 
 === AGENT MESSAGE ===
@@ -205,7 +248,7 @@ Example:
 Trusted Facts: {facts_section}
 Research Progress: {context_section}
 
-IMPORTANT: You MUST score ALL and ONLY these components: {', '.join(component_labels)}
+IMPORTANT: You MUST score ALL and ONLY these components: {labels_text}
 
 For each criterion, score 1-10 based on HOW STRONGLY the criterion is matched/triggered:
 - 1-3: Criterion is NOT relevant to this message (no match)
@@ -220,8 +263,8 @@ Return valid JSON with EXACTLY the component labels provided above.
 
 Example format (using YOUR component labels):
 {{
-  "component_scores": {json.dumps(example_scores, indent=4)},
-  "component_reasoning": {json.dumps(example_reasoning, indent=4)}
+  "component_scores": {example_scores_json},
+  "component_reasoning": {example_reasoning_json}
 }}
 """
 
@@ -12,10 +12,10 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Literal
 
-import yaml
-
 from autogen_core.models import ChatCompletionClient
 
+from utils.yaml_utils import load_cached_yaml
+
 
 ModelProvider = Literal["openai", "anthropic"]
 
@@ -53,8 +53,7 @@ class ModelClientFactory:
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Model config not found at: {self.config_path}")
 
-        with open(self.config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        config_data = load_cached_yaml(self.config_path)
 
         if not config_data or "model_clients" not in config_data:
             raise ValueError("Invalid model.yaml: must contain 'model_clients' section")
@@ -1,13 +1,13 @@
 # Standard library imports
+import importlib.util
 import logging
 import os
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Sequence
 
 # Third-party imports
-import openai
-import yaml
 from autogen_agentchat.agents import AssistantAgent, UserProxyAgent
 from autogen_agentchat.agents._user_control_agent import UserControlAgent
 from autogen_agentchat.conditions import TextMentionTermination, ExternalTermination
@@ -17,7 +17,8 @@ from autogen_agentchat.teams._group_chat._selector_group_chat import SelectorGro
 from autogen_core import CancellationToken
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.tools.mcp import McpWorkbench, StdioServerParams, SseServerParams
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 # Plugin imports
 from autogen_agentchat.teams._group_chat.plugins.state_context import StateContextPlugin
@@ -30,7 +31,8 @@ from autogen_agentchat.teams._group_chat.plugins.analysis_watchlist import (
 # Local imports
 from agents.PlannerAgent import PlannerAgent
 from handlers.agent_input_queue import AgentInputQueue
-from tools.FilteredWorkbench import FilteredWorkbench
+from tools.FilteredWorkbench import FilteredWorkbench, _list_underlying_tools
+from utils.yaml_utils import load_cached_yaml
 from teams.hierarchical_groupchat import HierarchicalGroupChat, HierarchicalGroupChatManager
 
 from factory.registry import FunctionRegistry
@@ -42,6 +44,56 @@ from factory.input_function_loader import InputFunctionLoader
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# The default selector only looks this far back in the thread for the last chat message
+_SELECTOR_LOOKBACK = 64
+
+# One connection pool for every OpenAI client the factory builds, so agents, the selector and the
+# prompt enhancer reuse warm connections instead of each opening their own. HTTP/2 is used when `h2`
+# is installed. The clients built here must not be closed, as that would close the shared pool.
+_openai_http_client: httpx.AsyncClient | None = None
+
+
+def _get_openai_http_client() -> httpx.AsyncClient:
+    global _openai_http_client
+    if _openai_http_client is None:
+        _openai_http_client = DefaultAsyncHttpxClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _openai_http_client
+
+
+# One MCP workbench per server URL, shared by every run in the process. The session is opened lazily
+# by the first tool call and then kept, instead of being connected, closed and reconnected per run.
+_mcp_workbenches: dict[str, McpWorkbench] = {}
+
+
+def _mcp_session_dead(workbench: McpWorkbench) -> bool:
+    """
+    True if the workbench was started but its session actor has since stopped (e.g. the SSE connection
+    dropped or the server restarted). Such a workbench fails every later call and cannot be restarted.
+    """
+    actor = getattr(workbench, "_actor", None)
+    if actor is None:
+        return False  # not started yet, the next call connects
+    task = getattr(actor, "_actor_task", None)
+    return not getattr(actor, "_active", False) or task is None or task.done()
+
+
+async def _get_mcp_workbench(params) -> McpWorkbench:
+    workbench = _mcp_workbenches.get(params.url)
+    if workbench is not None and _mcp_session_dead(workbench):
+        logger.warning(f"MCP session to {params.url} is gone, reconnecting")
+        try:
+            await workbench.stop()
+        except Exception:
+            pass  # the actor is already down
+        workbench = None
+    if workbench is None:
+        workbench = McpWorkbench(server_params=params)
+        _mcp_workbenches[params.url] = workbench
+    return workbench
+
 
 
 async def enhance_selector_prompt(
@@ -102,13 +154,42 @@ def load_data():
     # Use relative path - team.yaml is in the same factory directory
     config_path = Path(__file__).parent / "team.yaml"
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-        f.close()
-        return data
+    return load_cached_yaml(config_path)
 
 config_data = load_data()
 
+
+def _mcp_server_params():
+    """The MCP server params configured in team.yaml, or None if the team has no MCP server."""
+    team_cfg = config_data["team"]
+    if team_cfg["mcp_url"] is None:
+        return None
+    return globals()[team_cfg["params_class"]](
+        url = team_cfg["mcp_url"],
+        timeout = team_cfg.get("mcp_timeout", 60)
+    )
+
+
+async def warm_up_mcp_workbench() -> None:
+    """Connects the shared MCP workbench and caches its tool list, so the first run does not wait for it."""
+    params = _mcp_server_params()
+    if params is None:
+        return
+    try:
+        await _list_underlying_tools(await _get_mcp_workbench(params))
+    except Exception as e:
+        logger.warning(f"MCP warm-up failed, the first run will connect instead: {e}")
+
+
+async def close_mcp_workbenches() -> None:
+    """Closes the shared MCP sessions; called on application shutdown."""
+    for workbench in _mcp_workbenches.values():
+        try:
+            await workbench.stop()
+        except Exception:
+            pass  # never started, or its session already died
+    _mcp_workbenches.clear()
+
 @dataclass
 class AgentTeamContext:
 
@@ -129,13 +210,15 @@ async def init_team(
     congress: str | None = None
 ) -> AgentTeamContext:
 
+    http_client = _get_openai_http_client()
     model_client = OpenAIChatCompletionClient(
         model=config_data["llm"]["model_client_args"]["model"],
-        api_key=api_key
+        api_key=api_key,
+        http_client=http_client
     )
 
     agents = []
-    enhance_prompt_client = AsyncOpenAI(api_key=api_key)
+    enhance_prompt_client = AsyncOpenAI(api_key=api_key, http_client=http_client)
     has_user_proxy = config_data["team"]["group_chat_args"]["has_user_proxy"]
 
     registry = FunctionRegistry()
@@ -177,17 +260,9 @@ async def init_team(
 
         # Format user_proxy description with config values if available
         user_proxy_description = config_data["agents"][user_proxy_agent_name]["description"]
-        if company_name and bill_name and congress:
-            all_agent_names = list(config_data["agents"].keys())
-            agent_names_str = ", ".join(all_agent_names)
-            user_proxy_description = user_proxy_description.format(
-                company_name=company_name,
-                bill_name=bill_name,
-                bill=bill_name,
-                year=congress,
-                congress=congress,
-                agent_names=agent_names_str
-            )
+        description_kwargs = _description_placeholders(config_data, company_name, bill_name, congress)
+        if description_kwargs is not None:
+            user_proxy_description = user_proxy_description.format_map(description_kwargs)
 
         user_proxy = UserProxyAgent(
             name=user_proxy_agent_name,
@@ -196,20 +271,19 @@ async def init_team(
         )
         # UserProxyAgent will be added to agents list after build_agents
 
-    if config_data["team"]["mcp_url"] is not None:
-        params = globals()[config_data["team"]["params_class"]](
-            url = config_data["team"]["mcp_url"],
-            timeout = config_data["team"].get("mcp_timeout", 60)
+    # Determine group chat class and build appropriate selector
+    group_chat_class_name = config_data["team"]["group_chat_class"]
+
+    params = _mcp_server_params()
+    if params is not None:
+        agents = await build_agents(
+            await _get_mcp_workbench(params),
+            model_client=model_client,
+            loader=loader,
+            company_name=company_name,
+            bill_name=bill_name,
+            congress=congress
         )
-        async with McpWorkbench(server_params = params) as workbench:
-            agents = await build_agents(
-                workbench,
-                model_client=model_client,
-                loader=loader,
-                company_name=company_name,
-                bill_name=bill_name,
-                congress=congress
-            )
     else:
         agents = await build_agents(
             None,
@@ -244,9 +318,6 @@ async def init_team(
         )
         plugins.append(state_context_plugin)
 
-    # Determine group chat class and build appropriate selector
-    group_chat_class_name = config_data["team"]["group_chat_class"]
-
     # Create external termination for user-initiated termination
     external_termination = ExternalTermination()
 
@@ -334,6 +405,22 @@ async def init_team(
     )
 
 
+def _description_placeholders(
+    config_data: dict, company_name: str | None, bill_name: str | None, congress: str | None
+) -> dict[str, str] | None:
+    """Values for the {placeholders} in agent descriptions, or None when the run has no bill context."""
+    if not (company_name and bill_name and congress):
+        return None
+    return dict(
+        company_name=company_name,
+        bill_name=bill_name,
+        bill=bill_name,  # {bill} is same as {bill_name}
+        year=congress,    # {year} maps to congress
+        congress=congress,
+        agent_names=", ".join(config_data["agents"].keys())  # {agent_names} placeholder
+    )
+
+
 async def build_agents(
     workbench: McpWorkbench | None,
     model_client: OpenAIChatCompletionClient,
@@ -345,25 +432,17 @@ async def build_agents(
 
     agents = []
 
+    # The placeholder values are shared by every agent description, so they are built once
+    description_kwargs = _description_placeholders(config_data, company_name, bill_name, congress)
+
     for _, agent_cfg in config_data["agents"].items():
         # Skip UserProxyAgent - it's created separately in init_team with special handling
         if agent_cfg["agent_class"] == "UserProxyAgent":
             continue
         # Format agent description with config values if available
         description = agent_cfg["description"]
-        if company_name and bill_name and congress:
-            # Get all agent names for {agent_names} placeholder
-            all_agent_names = list(config_data["agents"].keys())
-            agent_names_str = ", ".join(all_agent_names)
-
-            description = description.format(
-                company_name=company_name,
-                bill_name=bill_name,
-                bill=bill_name,  # {bill} is same as {bill_name}
-                year=congress,    # {year} maps to congress
-                congress=congress,
-                agent_names=agent_names_str
-            )
+        if description_kwargs is not None:
+            description = description.format_map(description_kwargs)
 
         if workbench is None:
             python_tools = []
@@ -424,17 +503,20 @@ async def build_agents(
 def build_default_selector_prompt(agent_names: List[str], api_key: str) -> callable:
 
     # This function returns a default selector prompt that is called by the GCM and gives it access to the last message
-    def _default_selector(thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str| None:
-        last_msg = next((m for m in reversed(thread) if isinstance(m, BaseChatMessage)), None)
+    template = config_data["team"]["group_chat_args"]["default_selector_prompt"]
+    agent_name_set = frozenset(agent_names)
+    client = AsyncOpenAI(api_key=api_key, http_client=_get_openai_http_client())
+
+    async def _default_selector(thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> str| None:
+        last_msg = next((m for m in islice(reversed(thread), _SELECTOR_LOOKBACK) if isinstance(m, BaseChatMessage)), None)
         if not last_msg:
             return None
-        prompt = config_data["team"]["group_chat_args"]["default_selector_prompt"].format(
+        prompt = template.format(
             agent_names=agent_names,
             last_message=last_msg.content
         )
 
-        openai.api_key = api_key
-        response = openai.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that selects the next agent to call."},
@@ -442,10 +524,7 @@ def build_default_selector_prompt(agent_names: List[str], api_key: str) -> calla
             ]
         )
 
-        model_result = type("ModelResult", (), {"content": response.choices[0].message.content})()
-        if model_result.content.strip() in agent_names:
-            return model_result.content.strip()
-        else:
-            return None
+        content = (response.choices[0].message.content or "").strip()
+        return content if content in agent_name_set else None
     return _default_selector
 
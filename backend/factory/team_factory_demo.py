@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, List, Sequence
 
 # Third-party imports
 import openai
-import yaml
 from autogen_agentchat.agents import AssistantAgent, UserProxyAgent
 from autogen_agentchat.agents._user_control_agent import UserControlAgent
 from autogen_agentchat.conditions import MaxMessageTermination
@@ -23,6 +22,7 @@ from openai import AsyncOpenAI
 from agents.PlannerAgent import PlannerAgent
 from handlers.agent_input_queue import AgentInputQueue
 from tools.FilteredWorkbench import FilteredWorkbench
+from utils.yaml_utils import load_cached_yaml
 from teams.hierarchical_groupchat import HierarchicalGroupChat, HierarchicalGroupChatManager
 
 from factory.registry import FunctionRegistry
@@ -49,10 +49,7 @@ def load_data(config_file: str = "team_demo.yaml"):
     # Use relative path - config file is in the same factory directory
     config_path = Path(__file__).parent / config_file
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
-        f.close()
-        return data
+    return load_cached_yaml(config_path)
 
 
 config_data = load_data()
@@ -69,10 +69,25 @@ from models import (
     UserInterrupt,
 )
 from utils.summarization import init_summarizer, summarize_message
-from utils.yaml_utils import get_agent_details, get_agent_team_names, get_summarization_system_prompt, get_team_main_tasks
+from utils.yaml_utils import AgentDetail, get_agent_details, get_agent_team_names, get_summarization_system_prompt, get_team_main_tasks
 
 logger = logging.getLogger(__name__)
 
+# Model clients for one-off requests outside a run (component generation), one per (model, API key, base URL),
+# kept for the lifetime of the process so their connection pools stay warm across requests
+_standalone_clients: dict[tuple[str, str, str | None], OpenAIChatCompletionClient] = {}
+
+
+def _get_standalone_client(model: str, api_key: str) -> OpenAIChatCompletionClient:
+    # A changed key or endpoint gets a new client instead of reusing one built with the old settings
+    base_url = os.getenv("OPENAI_BASE_URL") or None
+    key = (model, api_key, base_url)
+    client = _standalone_clients.get(key)
+    if client is None:
+        client = OpenAIChatCompletionClient(model=model, api_key=api_key, base_url=base_url)
+        _standalone_clients[key] = client
+    return client
+
 
 class WebSocketHandler:
 
@@ -93,9 +108,13 @@ class WebSocketHandler:
         await self.websocket.accept()
 
         try:
-            team_names = get_agent_team_names()
+            # Both read team.yaml; load them off the event loop and in parallel
+            team_names, agents_data = await asyncio.gather(
+                asyncio.to_thread(get_agent_team_names),
+                asyncio.to_thread(get_agent_details),
+            )
             await self._send_agent_team_names(team_names)
-            await self._send_agent_details()
+            await self._send_agent_details(agents_data)
 
             while True:
                 message_data = await self.websocket.receive_text()
@@ -131,7 +150,7 @@ class WebSocketHandler:
                 await self._initialize_run()
                 await self._send_participant_names()
 
-                initial_topic = self.agent_team_config.initial_topic or get_team_main_tasks()
+                initial_topic = self.agent_team_config.initial_topic or await asyncio.to_thread(get_team_main_tasks)
 
                 if self.agent_team_config.company_name and self.agent_team_config.bill_name and self.agent_team_config.congress:
                     initial_topic = initial_topic.format(
@@ -184,12 +203,7 @@ class WebSocketHandler:
             if not api_key:
                 raise RuntimeError("OPENAI_API_KEY not set in environment")
 
-            temp_client = OpenAIChatCompletionClient(
-                model="gpt-4o-mini",
-                api_key=api_key
-            )
-
-            analysis_service = AnalysisService(model_client=temp_client)
+            analysis_service = AnalysisService(model_client=_get_standalone_client("gpt-4o-mini", api_key))
             components = await analysis_service.parse_prompt(request.analysis_prompt)
 
             response = ComponentGenerationResponse(
@@ -217,16 +231,18 @@ class WebSocketHandler:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY not set in environment")
 
-        summarization_prompt = get_summarization_system_prompt()
-        init_summarizer(api_key=api_key, model="gpt-4o-mini", system_prompt=summarization_prompt)
-
-        self.session.agent_team_context = await init_team(
-            api_key=api_key,
-            agent_input_queue=self.agent_input_queue,
-            company_name=self.agent_team_config.company_name,
-            bill_name=self.agent_team_config.bill_name,
-            congress=self.agent_team_config.congress
+        # The summarization prompt is read from the factory YAML files in a worker thread while the team is built
+        summarization_prompt, self.session.agent_team_context = await asyncio.gather(
+            asyncio.to_thread(get_summarization_system_prompt),
+            init_team(
+                api_key=api_key,
+                agent_input_queue=self.agent_input_queue,
+                company_name=self.agent_team_config.company_name,
+                bill_name=self.agent_team_config.bill_name,
+                congress=self.agent_team_config.congress
+            ),
         )
+        init_summarizer(api_key=api_key, model="gpt-4o-mini", system_prompt=summarization_prompt)
 
         self.session.state_manager.display_names = self.session.agent_team_context.display_names
 
@@ -649,9 +665,10 @@ class WebSocketHandler:
             except RuntimeError:
                 pass  # WebSocket disconnected during send
 
-    async def _send_agent_details(self) -> None:
+    async def _send_agent_details(self, agents_data: list[AgentDetail] | None = None) -> None:
         # Send agent details (names and descriptions) to frontend
-        agents_data = get_agent_details()
+        if agents_data is None:
+            agents_data = get_agent_details()
         agent_details_msg = AgentDetails(agents=agents_data)
         if self.websocket.client_state == WebSocketState.CONNECTED:
             try:
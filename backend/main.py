@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 
 from contextlib import asynccontextmanager
@@ -9,6 +10,7 @@ from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
+from factory.team_factory import close_mcp_workbenches, warm_up_mcp_workbench
 from handlers.websocket_handler import WebSocketHandler
 
 load_dotenv()
@@ -16,7 +18,11 @@ load_dotenv()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # The MCP handshake runs in the background while the app starts serving
+    warm_up = asyncio.create_task(warm_up_mcp_workbench())
     yield
+    warm_up.cancel()
+    await close_mcp_workbenches()
 
 app = FastAPI(
     title="Autogen Backend API",
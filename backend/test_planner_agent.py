@@ -0,0 +1,59 @@
+import asyncio
+
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+    UserMessage,
+)
+
+from agents.PlannerAgent import PlannerAgent
+
+_NO_USAGE = RequestUsage(prompt_tokens=0, completion_tokens=0)
+
+
+class EchoModelClient(ChatCompletionClient):
+    """Replies with every user message it was sent, so a test can see what a run's model context held."""
+
+    async def create(self, messages, **kwargs) -> CreateResult:
+        seen = [m.content for m in messages if isinstance(m, UserMessage)]
+        return CreateResult(finish_reason="stop", content=" | ".join(seen), usage=_NO_USAGE, cached=False)
+
+    def create_stream(self, messages, **kwargs):
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    def actual_usage(self) -> RequestUsage:
+        return _NO_USAGE
+
+    def total_usage(self) -> RequestUsage:
+        return _NO_USAGE
+
+    def count_tokens(self, messages, **kwargs) -> int:
+        return 0
+
+    def remaining_tokens(self, messages, **kwargs) -> int:
+        return 1_000_000
+
+    @property
+    def capabilities(self) -> ModelCapabilities:
+        return ModelCapabilities(vision=False, function_calling=False, json_output=False)
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return ModelInfo(vision=False, function_calling=False, json_output=False, family="unknown", structured_output=False)
+
+
+def test_run_batch_async_isolates_runs():
+    agent = PlannerAgent("planner", model_client=EchoModelClient())
+
+    results = asyncio.run(agent.run_batch_async(["first task", "second task"], concurrency=2))
+
+    # Each run only saw its own task, and the results come back in task order
+    assert [result.messages[-1].content for result in results] == ["first task", "second task"]
+    # The batch never touched the original agent's context
+    assert asyncio.run(agent._model_context.get_messages()) == []
@@ -96,4 +96,10 @@ async def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # uvicorn[standard] already ships uvloop; use it for standalone runs too
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
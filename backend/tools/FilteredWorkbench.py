@@ -1,10 +1,45 @@
 # This is the MCP tool workbench that we can use to filter the tools an agent can use
 # in the beginning, at the agent's conception
 
-from autogen_ext.tools.mcp import McpWorkbench
+import asyncio
+import json
+import os
+import time
+import types
+import weakref
+from collections import OrderedDict
+
+from autogen_ext.tools.mcp import McpServerParams, McpWorkbench
 from typing import List, Mapping, Any
 from autogen_core.tools import ToolSchema, ToolResult
 
+# Every FilteredWorkbench over the same McpWorkbench shares one list_tools round-trip to the server
+_TOOLS_CACHE: "weakref.WeakKeyDictionary[McpWorkbench, List[ToolSchema]]" = weakref.WeakKeyDictionary()
+_TOOLS_LOCK = asyncio.Lock()
+
+
+async def _list_underlying_tools(workbench: McpWorkbench) -> List[ToolSchema]:
+    tools = _TOOLS_CACHE.get(workbench)
+    if tools is None:
+        async with _TOOLS_LOCK:
+            tools = _TOOLS_CACHE.get(workbench)
+            if tools is None:
+                tools = await workbench.list_tools()
+                _TOOLS_CACHE[workbench] = tools
+    return tools
+
+# Opt-in cache of successful tool results, set FILTERED_WORKBENCH_CACHE_TTL to a number of seconds to enable it.
+# Results are kept per underlying workbench (and dropped with it), keyed on (tool name, arguments), and expire
+# after the TTL so live MCP data is refreshed even when one workbench is shared across runs
+_RESULT_CACHE: "weakref.WeakKeyDictionary[McpWorkbench, OrderedDict[tuple[str, str], tuple[float, ToolResult]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_RESULT_CACHE_MAX = 128
+_RESULT_CACHE_TTL = float(os.getenv("FILTERED_WORKBENCH_CACHE_TTL", "0"))
+
+# Shared read-only stand-in for calls made without arguments
+_EMPTY: Mapping[str, Any] = types.MappingProxyType({})
+
 class FilteredWorkbench(McpWorkbench):
     """
     A workbench that wraps an existing McpWorkbench to provide a filtered-down
@@ -13,13 +48,35 @@ class FilteredWorkbench(McpWorkbench):
 
     def __init__(self, underlying_workbench: McpWorkbench, allowed_tool_names: List[str]):
         self._underlying = underlying_workbench
-        self._allowed_names = set(allowed_tool_names)
-        super().__init__(server_params=self._underlying.server_params)
+        self._allowed_names = frozenset(allowed_tool_names)
+        self._filtered_cache: List[ToolSchema] | None = None
+        # No super().__init__: the wrapper never opens its own MCP session, every call goes
+        # through the shared session of the underlying workbench
+
+    @property
+    def server_params(self) -> McpServerParams:
+        return self._underlying.server_params
+
+    async def start(self) -> None:
+        """The session lifecycle belongs to the underlying workbench."""
+
+    async def stop(self) -> None:
+        """The session lifecycle belongs to the underlying workbench."""
+
+    async def reset(self) -> None:
+        """The session lifecycle belongs to the underlying workbench."""
+
+    def __del__(self) -> None:
+        # There is no session actor of our own to clean up
+        pass
 
     async def list_tools(self) -> List[ToolSchema]:
         """Returns only the tools that are in the allowed list."""
-        all_tools = await self._underlying.list_tools()
-        return [tool for tool in all_tools if tool["name"] in self._allowed_names and tool["description"]]
+        # The allowed names never change after construction, so the filtered list is computed once
+        if self._filtered_cache is None:
+            all_tools = await _list_underlying_tools(self._underlying)
+            self._filtered_cache = [tool for tool in all_tools if tool["name"] in self._allowed_names and tool["description"]]
+        return self._filtered_cache
 
     async def call_tool(self, name: str, arguments: Mapping[str, Any] | None = None, **kwargs) -> ToolResult:
         """
@@ -29,8 +86,28 @@ class FilteredWorkbench(McpWorkbench):
         if name not in self._allowed_names:
             raise ValueError(f"Tool '{name}' is not available to this agent.")
 
-        args_to_send = arguments or {}
-        return await self._underlying.call_tool(name, args_to_send, **kwargs)
+        args_to_send = arguments if arguments else _EMPTY
+        if _RESULT_CACHE_TTL <= 0:
+            return await self._underlying.call_tool(name, args_to_send, **kwargs)
+
+        results = _RESULT_CACHE.get(self._underlying)
+        if results is None:
+            results = _RESULT_CACHE[self._underlying] = OrderedDict()
+        # dict() so a call without arguments gets the same key as a call with a literal {}
+        cache_key = (name, json.dumps(dict(args_to_send), sort_keys=True, default=str))
+        cached = results.get(cache_key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if expires_at > time.monotonic():
+                results.move_to_end(cache_key)
+                return cached_result
+            del results[cache_key]
+        result = await self._underlying.call_tool(name, args_to_send, **kwargs)
+        if not result.is_error:
+            results[cache_key] = (time.monotonic() + _RESULT_CACHE_TTL, result)
+            if len(results) > _RESULT_CACHE_MAX:
+                results.popitem(last=False)
+        return result
 
     def _to_config(self) -> Mapping[str, Any]:
         raise NotImplementedError("FilteredWorkbench is not designed to be serializable.")
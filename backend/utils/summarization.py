@@ -9,6 +9,17 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# init_summarizer runs once per run; the OpenAI client (and its connection pool) is kept per API key
+_clients: dict[str, AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    client = _clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key)
+        _clients[api_key] = client
+    return client
+
 
 class MessageSummarizer:
     """
@@ -24,7 +35,7 @@ class MessageSummarizer:
             model: Model to use for summarization (default: gpt-4o-mini for cost efficiency)
             system_prompt: Custom system prompt for summarization (optional)
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
         self.model = model
         self.system_prompt = system_prompt or (
             "You are a concise summarizer. Your task is to create brief, clear summaries "
@@ -1,8 +1,81 @@
 """Utility functions for reading YAML configuration files."""
 
+import hashlib
+import json
+import os
+import tempfile
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import List, TypedDict
+from typing import Any, List, TypedDict
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Parsed YAML is cached as JSON here, outside the source tree
+_YAML_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "autogen-interrupt" / "yaml"
+
+
+def _yaml_cache_path(path: str) -> Path:
+    # Files with the same name in different directories get different cache entries
+    digest = hashlib.blake2b(os.path.abspath(path).encode(), digest_size=8).hexdigest()
+    return _YAML_CACHE_DIR / f"{Path(path).stem}-{digest}.json"
+
+
+def load_cached_yaml(path: str | os.PathLike) -> Any:
+    """
+    Load a YAML file through a JSON cache.
+
+    The parsed result is written to a JSON file in the user's cache directory and
+    reused for as long as it is at least as new as the YAML file, which skips the
+    YAML parser on every later load. Data that does not survive a JSON round trip
+    (e.g. non-string keys) is returned without being cached.
+    """
+    path = os.fspath(path)
+    cache_path = _yaml_cache_path(path)
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as f:
+                return _json_loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    try:
+        dumped = json.dumps(data)
+        if json.loads(dumped) == data:
+            _YAML_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # A unique temporary file per writer, so concurrent processes never write to the same file
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=_YAML_CACHE_DIR, suffix=".tmp", delete=False
+            ) as f:
+                f.write(dumped)
+            os.replace(f.name, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    return data
+
+
+_FACTORY_DIR = Path(__file__).parent.parent / "factory"
+_TEAM_YAML = _FACTORY_DIR / "team.yaml"
+
+
+@lru_cache(maxsize=None)
+def _factory_yaml_files() -> tuple[Path, ...]:
+    # The set of shipped team configs is fixed for the lifetime of the process
+    return tuple(_FACTORY_DIR.glob("*.yaml"))
 
 
 class AgentDetail(TypedDict):
@@ -14,14 +87,10 @@ class AgentDetail(TypedDict):
 
 def get_agent_team_names() -> List[str]:
     # Read team_name from team.yaml only (other yaml files are backups)
-    factory_dir = Path(__file__).parent.parent / "factory"
-    team_yaml = factory_dir / "team.yaml"
-
     try:
-        with open(team_yaml, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-            if data and "team_name" in data:
-                return [data["team_name"]]
+        data = load_cached_yaml(_TEAM_YAML)
+        if data and "team_name" in data:
+            return [data["team_name"]]
     except Exception as e:
         raise ValueError(f"Could not read team_name from team.yaml: {e}")
 
@@ -30,14 +99,11 @@ def get_agent_team_names() -> List[str]:
 
 def load_team_config_by_name(team_name: str) -> dict:
     # Find and load YAML config that matches the given team_name
-    factory_dir = Path(__file__).parent.parent / "factory"
-
-    for yaml_file in factory_dir.glob("*.yaml"):
+    for yaml_file in _factory_yaml_files():
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data and data.get("team_name") == team_name:
-                    return data
+            data = load_cached_yaml(yaml_file)
+            if data and data.get("team_name") == team_name:
+                return data
         except Exception:
             continue
 
@@ -50,21 +116,18 @@ def get_team_main_tasks() -> str:
     Scan factory directory for .yaml files and return the main_task description string.
     Only includes yaml files with both 'team_name' and 'tasks.main_task.description' present.
     """
-    factory_dir = Path(__file__).parent.parent / "factory"
-
-    for yaml_file in factory_dir.glob("*.yaml"):
+    for yaml_file in _factory_yaml_files():
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if (
-                    data
-                    and "team_name" in data
-                    and "tasks" in data
-                    and isinstance(data["tasks"], dict)
-                    and "main_task" in data["tasks"]
-                ):
-                    main_task = data["tasks"]["main_task"]
-                    return main_task["description"]
+            data = load_cached_yaml(yaml_file)
+            if (
+                data
+                and "team_name" in data
+                and "tasks" in data
+                and isinstance(data["tasks"], dict)
+                and "main_task" in data["tasks"]
+            ):
+                main_task = data["tasks"]["main_task"]
+                return main_task["description"]
 
         except Exception:
             continue
@@ -77,20 +140,17 @@ def get_summarization_system_prompt() -> str:
     Scan factory directory for .yaml files and return the summarization_system_prompt string.
     Only includes yaml files with both 'team_name' and 'prompts.summarization_system_prompt' present.
     """
-    factory_dir = Path(__file__).parent.parent / "factory"
-
-    for yaml_file in factory_dir.glob("*.yaml"):
+    for yaml_file in _factory_yaml_files():
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if (
-                    data
-                    and "team_name" in data
-                    and "prompts" in data
-                    and isinstance(data["prompts"], dict)
-                    and "summarization_system_prompt" in data["prompts"]
-                ):
-                    return data["prompts"]["summarization_system_prompt"]
+            data = load_cached_yaml(yaml_file)
+            if (
+                data
+                and "team_name" in data
+                and "prompts" in data
+                and isinstance(data["prompts"], dict)
+                and "summarization_system_prompt" in data["prompts"]
+            ):
+                return data["prompts"]["summarization_system_prompt"]
 
         except Exception:
             continue
@@ -103,11 +163,8 @@ def get_agent_details() -> List[AgentDetail]:
     Extract agent details from team.yaml in the factory directory.
     Returns a list of agents with their names, display names, and UI summaries.
     """
-    team_yaml = Path(__file__).parent.parent / "factory" / "team.yaml"
-
     try:
-        with open(team_yaml, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = load_cached_yaml(_TEAM_YAML)
     except Exception as e:
         raise ValueError(f"Could not read team.yaml: {e}")
 
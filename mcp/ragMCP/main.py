@@ -1,4 +1,4 @@
-import os, re, yaml, requests
+import os, re, requests
 import xml.etree.ElementTree as ET
 import sys
 
@@ -8,6 +8,7 @@ from mcp.server.fastmcp import FastMCP
 from util.parse.parse import _call_and_parse, _parse_congress_index_from_args
 from util.parse.crep import _parse_committee_report_text_links
 from util.parse.committee import _get_committee_code, rectify_committee_arguments
+from util.parse.yaml_cache import _load_cached_yaml
 from util.parse.amendment import _searchAmendmentInCR
 from util.parse.text_parse import _extract_htm_pdf_from_xml
 from util.parse.votes import _parse_roll_call_number_house
@@ -255,8 +256,7 @@ class MCPServerWrapper:
         committee_code = committee_code.lower()
         debug_messages.append(f"committee_code obtained: {committee_code}")
 
-        with open(committee_data_path, 'r') as f:
-            data = yaml.safe_load(f)
+        data = _load_cached_yaml(committee_data_path)
 
         try:
             committee_id = f"{committee_code}_{congress}"
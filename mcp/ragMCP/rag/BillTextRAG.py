@@ -17,6 +17,15 @@ from rag.util.api.authenticate import _get_key
 oai_key = _get_key("OPENAI_API_KEY")
 langsmith_key = _get_key("LANGCHAIN_API_KEY")
 
+# A BillTextRAG is built per tool call; the chat model holds no per-request state, so all of them share one
+_chat_model: Optional[ChatOpenAI] = None
+
+def _get_chat_model() -> ChatOpenAI:
+    global _chat_model
+    if _chat_model is None:
+        _chat_model = ChatOpenAI(model="gpt-4.1")
+    return _chat_model
+
 class BillTextRAG:
 
     def __init__(self, 
@@ -102,7 +111,7 @@ class BillTextRAG:
 
         self.generate_queries = (
             self.lobbying_strategy_prompt
-            | ChatOpenAI(model="gpt-4.1")
+            | _get_chat_model()
             | StrOutputParser()
             | (lambda x: x.split("\n"))
         )
@@ -111,7 +120,7 @@ class BillTextRAG:
 
         self.single_retrieval_chain = get_single_retrieval_chain(self.generate_queries, self.retriever)
 
-        self.llm = ChatOpenAI(model="gpt-4.1")
+        self.llm = _get_chat_model()
 
 
     def run_relevant_sections(self, company_name: str, bill_text: str, bill_summary_text: str) -> str:
@@ -1,5 +1,7 @@
-import configparser, os
+import configparser, functools, os
 
+# The secrets file does not change while the server runs, so it is read only once
+@functools.lru_cache(maxsize=1)
 def _get_oai_key():
     config = configparser.ConfigParser()
     path = os.path.join(os.path.dirname(__file__), "..", "secrets.ini")
@@ -2,11 +2,16 @@ import os
 import yaml
 import json
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 local_path = os.path.dirname(os.path.abspath(__file__))
 
 def load_prompts():
     with open(f"{local_path}/../../config/prompts.yaml", "r") as f:
-        prompts = yaml.safe_load(f)
+        prompts = yaml.load(f, Loader=_YamlLoader)
     return prompts
 
 # PREVIOUSLY: getSectionText
@@ -0,0 +1,22 @@
+import os
+import stat
+
+
+def _private_cache_dir(name: str) -> str | None:
+    """
+    Returns a cache directory that only the current user can read and write, creating it with mode 0700.
+    Returns None (so callers skip the disk cache) when the directory cannot be created or is not private,
+    e.g. because another user created it first.
+    """
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    path = os.path.join(base, "ragmcp", name)
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_mode & 0o077:
+        return None
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return None
+    return path
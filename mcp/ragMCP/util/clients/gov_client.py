@@ -4,10 +4,18 @@
     @copyright: 2022, Library of Congress
     @license: CC0 1.0
 """
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
 from urllib.parse import urljoin
 
 import requests
 
+from util.cache_dir import _private_cache_dir
+
 
 API_VERSION = "v3"
 ROOT_URL_CONGRESS = "https://api.congress.gov/"
@@ -16,6 +24,45 @@ PAGE_LIMIT_CONGRESS = 250
 
 ROOT_URL_GPO = "https://api.govinfo.gov/"
 
+# Successful GET responses are kept on disk for this many seconds, so repeated runs on the same
+# bill do not hit the APIs again. RAGMCP_HTTP_CACHE_TTL=0 disables the cache.
+# Entries are plain JSON in a directory private to the current user, so the cache cannot be poisoned by other users.
+HTTP_CACHE_TTL = int(os.getenv("RAGMCP_HTTP_CACHE_TTL", "86400"))
+HTTP_CACHE_DIR = _private_cache_dir("http") if HTTP_CACHE_TTL > 0 else None
+
+
+def _cache_path(url, args, kwargs):
+    key = hashlib.blake2b(repr((url, args, sorted(kwargs.items()))).encode(), digest_size=16).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, f"{key}.json")
+
+
+def _read_cache(path):
+    try:
+        if time.time() - os.stat(path).st_mtime > HTTP_CACHE_TTL:
+            return None
+        with open(path, "r") as f:
+            entry = json.load(f)
+        if "json" in entry:
+            return entry["json"], entry["status"]
+        return base64.b64decode(entry["content"]), entry["status"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(path, value):
+    body, status = value
+    if isinstance(body, bytes):
+        entry = {"status": status, "content": base64.b64encode(body).decode("ascii")}
+    else:
+        entry = {"status": status, "json": body}
+    # Write to a temporary file first so concurrent readers never see a partial entry
+    try:
+        with tempfile.NamedTemporaryFile("w", dir=HTTP_CACHE_DIR, suffix=".tmp", delete=False) as f:
+            json.dump(entry, f)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
 
 class _MethodWrapper:
     """ Wrap request method to facilitate queries.  Supports requests signature. """
@@ -23,16 +70,26 @@ class _MethodWrapper:
     def __init__(self, parent, http_method):
         self._parent = parent
         self._method = getattr(parent._session, http_method)
+        self._cacheable = http_method == "get" and HTTP_CACHE_DIR is not None
 
     def __call__(self, endpoint, *args, **kwargs):  # full signature passed here
-        response = self._method(
-            urljoin(self._parent.base_url, endpoint), *args, **kwargs
-        )
+        url = urljoin(self._parent.base_url, endpoint)
+        cache_path = _cache_path(url, args, kwargs) if self._cacheable else None
+        if cache_path is not None:
+            cached = _read_cache(cache_path)
+            if cached is not None:
+                return cached
+
+        response = self._method(url, *args, **kwargs)
         # unpack
         if response.headers.get("content-type", "").startswith("application/json"):
-            return response.json(), response.status_code
+            result = response.json(), response.status_code
         else:
-            return response.content, response.status_code
+            result = response.content, response.status_code
+
+        if cache_path is not None and response.status_code == 200:
+            _write_cache(cache_path, result)
+        return result
 
 
 class CDGClient:
@@ -1,4 +1,6 @@
-import yaml, re, os
+import re, os
+
+from util.parse.yaml_cache import _load_cached_yaml
 
 local_path = os.path.dirname(os.path.abspath(__file__))
 
@@ -7,8 +9,7 @@ def _get_committee_code(name: str) -> dict:
     path = os.path.join(local_path, "../../data/committees/committees_standing.yaml")
     debug_messages.append(f"Loading YAML from: {path}")
 
-    with open(path, "r") as f:
-        committees = yaml.safe_load(f)
+    committees = _load_cached_yaml(path)
 
     raw = name.strip()
     debug_messages.append(f"Raw input: {raw}")
@@ -0,0 +1,53 @@
+import os, pickle, hashlib, tempfile
+import yaml
+
+from util.cache_dir import _private_cache_dir
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed YAML files are pickled here, so a file is only parsed again after it changes. The directory is private
+# to the current user, since unpickling a planted file would run arbitrary code; None disables the disk cache
+cache_dir = _private_cache_dir("yaml")
+
+# Parsed data kept in this process, keyed by absolute path -> (cache key, data); callers only read it
+_memory_cache = {}
+
+def _load_cached_yaml(path: str):
+    """
+    Loads a YAML file through an in-process cache backed by an on-disk pickle cache.
+    Entries are keyed by (path, mtime, size), so editing or replacing the file invalidates them.
+    """
+    st = os.stat(path)
+    abs_path = os.path.abspath(path)
+    key = hashlib.blake2b(f"{abs_path}:{st.st_mtime_ns}:{st.st_size}".encode(), digest_size=16).hexdigest()
+    cached = _memory_cache.get(abs_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    cache_path = os.path.join(cache_dir, f"{key}.pkl") if cache_dir else None
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, "rb") as f:
+                data = pickle.load(f)
+            _memory_cache[abs_path] = (key, data)
+            return data
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    # Write to a temporary file first so concurrent readers never see a partial pickle
+    if cache_path is not None:
+        try:
+            with tempfile.NamedTemporaryFile("wb", dir=cache_dir, suffix=".tmp", delete=False) as f:
+                pickle.dump(data, f, protocol=5)
+            os.replace(f.name, cache_path)
+        except OSError:
+            pass
+
+    _memory_cache[abs_path] = (key, data)
+    return data